@@ -4,33 +4,116 @@ import subprocess
 import json
 import sys
 import os
-import shlex
 import re
 import pathlib
 import time
-import textwrap
+import heapq
 import threading
 import logging
 import signal
-from typing import Dict, List, Tuple, Optional, Any, Union
-from dataclasses import dataclass, asdict
-from enum import Enum
-from collections import defaultdict
-import math
+import asyncio
+from typing import Dict, List, Tuple, Optional, Any, Iterator, Callable, Union
+from dataclasses import dataclass, field, fields
+from enum import IntEnum
 import shutil
+import tempfile
 import importlib.util
-from datetime import datetime, timedelta
+import functools
 from concurrent.futures import ThreadPoolExecutor, as_completed
 
-try:
-    from tabulate import tabulate
-    HAS_TABULATE = True
-except ImportError:
-    HAS_TABULATE = False
-
 logging.basicConfig(level=logging.WARNING, format='%(levelname)s: %(message)s')
 logger = logging.getLogger(__name__)
 
+_GIB = 1024 ** 3
+_SIZE_UNITS = ((1024.0, 1024.0, "TB"), (1.0, 1.0, "GB"), (1 / 1024, 1 / 1024, "MB"))
+
+_LVM_REPORT_ARGS = ["--reportformat", "json", "--units", "b", "--nosuffix"]
+_PV_FIELDS = "pv_name,vg_name,pv_size,pv_free,pv_used,pv_attr,pv_uuid"
+_VG_FIELDS = "vg_name,vg_size,vg_free,vg_attr,pv_count,lv_count,vg_uuid,vg_extent_size,vg_lock_type,vg_lock_args"
+_LV_FIELDS = "lv_name,vg_name,lv_size,lv_attr,pool_lv,origin,lv_uuid,segments,raid_sync_percent,cache_total_blocks,cache_used_blocks,data_percent,metadata_percent,thin_count"
+_PVS_CMD = ["pvs", *_LVM_REPORT_ARGS, "-o", _PV_FIELDS]
+_VGS_CMD = ["vgs", *_LVM_REPORT_ARGS, "-o", _VG_FIELDS]
+_LVS_CMD = ["lvs", *_LVM_REPORT_ARGS, "-o", _LV_FIELDS]
+_FULLREPORT_CMD = ["lvm", "fullreport", *_LVM_REPORT_ARGS,
+                   "--configreport", "pv", "-o", _PV_FIELDS,
+                   "--configreport", "vg", "-o", _VG_FIELDS,
+                   "--configreport", "lv", "-o", _LV_FIELDS]
+_CACHE_POOLS_CMD = ["lvs", *_LVM_REPORT_ARGS,
+                    "-o", "lv_name,vg_name,cache_total_blocks,cache_used_blocks,cache_dirty_blocks,lv_uuid",
+                    "--select", "lv_attr=~C.*"]
+
+_PV_HEADERS = ["PV Name", "VG Name", "Size", "Free", "Used %", "Status", "Disk Errors", "Health"]
+_VG_HEADERS = ["VG Name", "Size", "Free", "Free %", "PVs", "LVs", "Lock", "Health"]
+_LV_HEADERS = ["VG Name", "LV Name", "Size", "Type", "Pool", "Origin", "RAID Sync", "Cache %", "Health"]
+_THIN_POOL_HEADERS = ["VG Name", "Pool Name", "Data Used %", "Meta Used %", "Thin Volumes", "Health"]
+_CACHE_POOL_HEADERS = ["VG Name", "Pool Name", "Total Blocks", "Used Blocks", "Usage %", "Dirty Blocks", "Health"]
+_DISK_HEADERS = ["Disk", "Model", "Size", "R/W Errors", "Temp", "Realloc", "Health"]
+
+_DETAIL_TABLES = (
+    ('pvs', "PHYSICAL VOLUMES", _PV_HEADERS),
+    ('vgs', "VOLUME GROUPS", _VG_HEADERS),
+    ('lvs', "LOGICAL VOLUMES", _LV_HEADERS),
+    ('thin_pools', "THIN POOLS", _THIN_POOL_HEADERS),
+    ('cache_pools', "CACHE POOLS", _CACHE_POOL_HEADERS),
+    ('disks', "DISK HEALTH", _DISK_HEADERS),
+)
+
+_PROM_HEALTH_HEADER = "# HELP lvm_health_check LVM health check metrics\n# TYPE lvm_health_check gauge\n"
+_PROM_VG_FREE_HEADER = ("\n# HELP lvm_volume_group_free_percent Volume group free space percentage\n"
+                        "# TYPE lvm_volume_group_free_percent gauge\n")
+_PROM_VG_SIZE_HEADER = ("\n# HELP lvm_volume_group_size Volume group total size in GB\n"
+                        "# TYPE lvm_volume_group_size gauge\n")
+_PROM_THIN_POOL_HEADER = ("\n# HELP lvm_thin_pool_usage Thin pool usage percentage\n"
+                          "# TYPE lvm_thin_pool_usage gauge\n")
+_PROM_DISK_ERRORS_HEADER = "\n# HELP lvm_disk_errors Disk I/O errors\n# TYPE lvm_disk_errors counter\n"
+_PROM_CACHE_POOL_HEADER = ("\n# HELP lvm_cache_pool_usage Cache pool usage percentage\n"
+                           "# TYPE lvm_cache_pool_usage gauge\n")
+_PROM_REALLOCATED_HEADER = ("\n# HELP lvm_disk_reallocated_sectors Reallocated disk sectors\n"
+                            "# TYPE lvm_disk_reallocated_sectors gauge\n")
+
+
+@functools.lru_cache(maxsize=None)
+def _load_tabulate():
+    try:
+        from tabulate import tabulate
+    except ImportError:
+        return None
+    return tabulate
+
+
+@functools.lru_cache(maxsize=None)
+def _load_orjson():
+    try:
+        import orjson
+    except ImportError:
+        return None
+    return orjson
+
+
+_MOUNTINFO_ESCAPE = re.compile(r'\\([0-7]{3})')
+
+
+def _unescape_mountinfo(value: str) -> str:
+    return _MOUNTINFO_ESCAPE.sub(lambda m: chr(int(m.group(1), 8)), value)
+
+
+@functools.lru_cache(maxsize=None)
+def _dm_major() -> Optional[str]:
+    try:
+        with open('/proc/devices', 'r') as f:
+            for line in f:
+                major, _, name = line.strip().partition(' ')
+                if name == 'device-mapper':
+                    return major
+    except OSError:
+        pass
+    return None
+
+
+@functools.lru_cache(maxsize=None)
+def _which(command: str) -> Optional[str]:
+    return shutil.which(command)
+
 
 class Color:
     RED = '\033[91m'
@@ -45,15 +128,54 @@ class Color:
     RESET = '\033[0m'
 
 
-class LVMStatus(Enum):
-    HEALTHY = "HEALTHY"
-    WARNING = "WARNING"
-    CRITICAL = "CRITICAL"
-    UNKNOWN = "UNKNOWN"
+class LVMStatus(IntEnum):
+    HEALTHY = 0
+    WARNING = 1
+    CRITICAL = 2
+    UNKNOWN = 3
+
 
+_STATUS_COLORS = {
+    LVMStatus.HEALTHY: Color.GREEN,
+    LVMStatus.WARNING: Color.YELLOW,
+    LVMStatus.CRITICAL: Color.RED,
+    LVMStatus.UNKNOWN: Color.MAGENTA
+}
+_STATUS_COLORED = {status: f"{color}{status.name}{Color.RESET}" for status, color in _STATUS_COLORS.items()}
+_STATUS_PLAIN = {status: status.name for status in LVMStatus}
 
-@dataclass
-class PhysicalVolume:
+
+class _CachedStatus:
+    __slots__ = ()
+    
+    @property
+    def lvm_status(self) -> LVMStatus:
+        if self._status is None:
+            object.__setattr__(self, '_status', self._compute_status())
+        return self._status
+
+
+@functools.lru_cache(maxsize=None)
+def _public_fields(cls: type) -> Tuple[str, ...]:
+    return tuple(f.name for f in fields(cls) if not f.name.startswith('_'))
+
+
+def _shallow_dict(obj: Any) -> Dict[str, Any]:
+    return {name: getattr(obj, name) for name in _public_fields(type(obj))}
+
+
+_LV_TYPES = {
+    't': "THIN", 'V': "THIN",
+    's': "SNAPSHOT", 'S': "SNAPSHOT",
+    'v': "VIRTUAL",
+    'm': "MIRRORED", 'M': "MIRRORED",
+    'r': "RAID", 'R': "RAID",
+    'C': "CACHE",
+}
+
+
+@dataclass(slots=True, frozen=True)
+class PhysicalVolume(_CachedStatus):
     name: str
     vg_name: str
     size_gb: float
@@ -65,12 +187,12 @@ class PhysicalVolume:
     uuid: Optional[str] = None
     disk_errors: Optional[int] = None
     disk_model: Optional[str] = None
+    _status: Optional[LVMStatus] = field(default=None, init=False, repr=False, compare=False)
     
-    @property
-    def lvm_status(self) -> LVMStatus:
-        if "unknown" in self.status.lower() or "missing" in self.status.lower():
+    def _compute_status(self) -> LVMStatus:
+        if self.status in ("UNKNOWN", "MISSING"):
             return LVMStatus.CRITICAL
-        if "inactive" in self.status.lower():
+        if self.status == "INACTIVE":
             return LVMStatus.WARNING
         if self.disk_errors and self.disk_errors > 10:
             return LVMStatus.CRITICAL
@@ -79,8 +201,8 @@ class PhysicalVolume:
         return LVMStatus.HEALTHY
 
 
-@dataclass
-class VolumeGroup:
+@dataclass(slots=True, frozen=True)
+class VolumeGroup(_CachedStatus):
     name: str
     size_gb: float
     free_gb: float
@@ -92,12 +214,14 @@ class VolumeGroup:
     lock_args: Optional[str] = None
     uuid: Optional[str] = None
     extent_size: Optional[str] = None
+    _status: Optional[LVMStatus] = field(default=None, init=False, repr=False, compare=False)
     
     @property
-    def lvm_status(self) -> LVMStatus:
-        if "p" in self.attributes:
-            return LVMStatus.CRITICAL
-        if "x" in self.attributes:
+    def is_degraded(self) -> bool:
+        return self.attributes[2:3] == "x" or self.attributes[3:4] == "p"
+    
+    def _compute_status(self) -> LVMStatus:
+        if self.is_degraded:
             return LVMStatus.CRITICAL
         if self.lock_type and self.lock_type not in ["normal", "None", ""]:
             return LVMStatus.WARNING
@@ -105,13 +229,11 @@ class VolumeGroup:
             return LVMStatus.CRITICAL
         if self.free_percent < 10:
             return LVMStatus.WARNING
-        if "p" not in self.attributes and "x" not in self.attributes:
-            return LVMStatus.HEALTHY
-        return LVMStatus.WARNING
+        return LVMStatus.HEALTHY
 
 
-@dataclass
-class LogicalVolume:
+@dataclass(slots=True, frozen=True)
+class LogicalVolume(_CachedStatus):
     name: str
     vg_name: str
     size_gb: float
@@ -125,36 +247,38 @@ class LogicalVolume:
     cache_used_blocks: Optional[int] = None
     uuid: Optional[str] = None
     segments: Optional[str] = None
+    _status: Optional[LVMStatus] = field(default=None, init=False, repr=False, compare=False)
     
     @property
-    def lvm_status(self) -> LVMStatus:
-        if "s" in self.attributes:
-            snapshot_status = self._check_snapshot_status()
-            if snapshot_status != LVMStatus.HEALTHY:
-                return snapshot_status
+    def volume_type(self) -> str:
+        return self.attributes[:1]
+    
+    @property
+    def is_active(self) -> bool:
+        return self.attributes[4:5] == "a"
+    
+    def _compute_status(self) -> LVMStatus:
+        volume_type = self.volume_type
+        if volume_type in ("S", "O"):
+            return LVMStatus.WARNING
         
-        if "a" not in self.attributes:
+        if not self.is_active:
             return LVMStatus.CRITICAL
-        if "m" in self.attributes:
+        if volume_type in ("m", "M"):
             return LVMStatus.WARNING
-        if "r" in self.attributes and self.raid_sync_percent is not None:
+        if volume_type in ("r", "R") and self.raid_sync_percent is not None:
             if self.raid_sync_percent < 100:
                 return LVMStatus.WARNING
-        if "C" in self.attributes and self.cache_used_blocks is not None and self.cache_total_blocks is not None:
+        if volume_type == "C" and self.cache_used_blocks is not None and self.cache_total_blocks is not None:
             if self.cache_total_blocks > 0:
                 cache_usage = (self.cache_used_blocks / self.cache_total_blocks * 100)
                 if cache_usage > 90:
                     return LVMStatus.WARNING
         return LVMStatus.HEALTHY
-    
-    def _check_snapshot_status(self) -> LVMStatus:
-        if "O" in self.attributes:
-            return LVMStatus.WARNING
-        return LVMStatus.HEALTHY
 
 
-@dataclass
-class ThinPool:
+@dataclass(slots=True, frozen=True)
+class ThinPool(_CachedStatus):
     name: str
     vg_name: str
     data_percent: float
@@ -163,9 +287,9 @@ class ThinPool:
     lv_uuid: Optional[str] = None
     metadata_size_gb: Optional[float] = None
     data_size_gb: Optional[float] = None
+    _status: Optional[LVMStatus] = field(default=None, init=False, repr=False, compare=False)
     
-    @property
-    def lvm_status(self) -> LVMStatus:
+    def _compute_status(self) -> LVMStatus:
         if self.data_percent > 95:
             return LVMStatus.CRITICAL
         if self.data_percent > 85:
@@ -177,17 +301,17 @@ class ThinPool:
         return LVMStatus.HEALTHY
 
 
-@dataclass
-class CachePool:
+@dataclass(slots=True, frozen=True)
+class CachePool(_CachedStatus):
     name: str
     vg_name: str
     cache_total_blocks: int
     cache_used_blocks: int
     cache_dirty_blocks: Optional[int] = None
     lv_uuid: Optional[str] = None
+    _status: Optional[LVMStatus] = field(default=None, init=False, repr=False, compare=False)
     
-    @property
-    def lvm_status(self) -> LVMStatus:
+    def _compute_status(self) -> LVMStatus:
         if self.cache_total_blocks == 0:
             return LVMStatus.UNKNOWN
         usage_percent = (self.cache_used_blocks / self.cache_total_blocks) * 100
@@ -198,7 +322,7 @@ class CachePool:
         return LVMStatus.HEALTHY
 
 
-@dataclass
+@dataclass(slots=True)
 class DiskInfo:
     name: str
     model: Optional[str] = None
@@ -210,7 +334,7 @@ class DiskInfo:
     reallocated_sectors: Optional[int] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class LVMHealthCheck:
     pvs: List[PhysicalVolume]
     vgs: List[VolumeGroup]
@@ -227,32 +351,12 @@ class LVMHealthCheck:
     
     @property
     def overall_status(self) -> LVMStatus:
-        critical_components = []
-        for pv in self.pvs:
-            if pv.lvm_status == LVMStatus.CRITICAL:
-                critical_components.append(f"PV:{pv.name}")
-        
-        for vg in self.vgs:
-            if vg.lvm_status == LVMStatus.CRITICAL:
-                critical_components.append(f"VG:{vg.name}")
-        
-        for lv in self.lvs:
-            if lv.lvm_status == LVMStatus.CRITICAL:
-                critical_components.append(f"LV:{lv.vg_name}/{lv.name}")
-        
-        for pool in self.thin_pools:
-            if pool.lvm_status == LVMStatus.CRITICAL:
-                critical_components.append(f"Pool:{pool.vg_name}/{pool.name}")
-        
-        for pool in self.cache_pools:
-            if pool.lvm_status == LVMStatus.CRITICAL:
-                critical_components.append(f"Cache:{pool.vg_name}/{pool.name}")
-        
-        for disk in self.disks:
-            if disk.read_errors > 10 or disk.write_errors > 10:
-                critical_components.append(f"Disk:{disk.name}")
-        
-        if critical_components:
+        if (any(pv.lvm_status is LVMStatus.CRITICAL for pv in self.pvs)
+                or any(vg.lvm_status is LVMStatus.CRITICAL for vg in self.vgs)
+                or any(lv.lvm_status is LVMStatus.CRITICAL for lv in self.lvs)
+                or any(pool.lvm_status is LVMStatus.CRITICAL for pool in self.thin_pools)
+                or any(pool.lvm_status is LVMStatus.CRITICAL for pool in self.cache_pools)
+                or any(disk.read_errors > 10 or disk.write_errors > 10 for disk in self.disks)):
             return LVMStatus.CRITICAL
         if self.warnings:
             return LVMStatus.WARNING
@@ -268,19 +372,29 @@ class LVMCheckPlugin:
 
 
 class LVMStateChecker:
-    def __init__(self, verbose: bool = False, color: bool = True, timeout: int = 30, config_file: Optional[str] = None):
+    def __init__(self, verbose: bool = False, color: bool = True, timeout: int = 30, config_file: Optional[str] = None,
+                 brief: bool = False, refresh: bool = False, tables: bool = True):
         self.verbose = verbose
+        self.brief = brief
+        self.show_tables = tables
+        self.refresh = refresh
         self.use_color = color and sys.stdout.isatty()
+        self._colorize = self._colorize_ansi if self.use_color else self._colorize_plain
         self.timeout = timeout
         self.health_check = None
         self._is_root = os.geteuid() == 0
         self._cache = {}
         self._cache_timestamp = 0
         self._cache_ttl = 300
+        self._state_cache_ttl = 30
+        self._fullreport_data = None
         self._cache_lock = threading.Lock()
         self.plugins = []
         self.config = self.load_config(config_file) if config_file and os.path.exists(config_file) else {}
         self.history_file = self.config.get('history_file', '/var/log/lvm-health-history.json')
+        self.state_cache_file = self.config.get('state_cache_file', f"/run/user/{os.getuid()}/lvm_state_cache.json")
+        self._state = {}
+        self._state_key = None
         
         self._signal_handler_setup()
         
@@ -313,7 +427,7 @@ class LVMStateChecker:
                 with open(config_file, 'r') as f:
                     for line in f:
                         if '=' in line and not line.startswith('#'):
-                            key, value = line.strip().split('=', 1)
+                            key, value = line.split('=', 1)
                             config[key.strip()] = value.strip()
         except Exception as e:
             if self.verbose:
@@ -327,25 +441,26 @@ class LVMStateChecker:
         return config
     
     def load_plugins(self, plugin_dir: str = "/usr/share/lvm-health-check/plugins") -> None:
-        if not os.path.exists(plugin_dir):
+        try:
+            with os.scandir(plugin_dir) as it:
+                plugin_files = [(e.name, e.path) for e in it
+                                if e.name.endswith('.py') and not e.name.startswith('__') and e.is_file()]
+        except OSError:
             return
         
-        for file in os.listdir(plugin_dir):
-            if file.endswith('.py') and not file.startswith('__'):
-                try:
-                    spec = importlib.util.spec_from_file_location(
-                        file[:-3], os.path.join(plugin_dir, file)
-                    )
-                    module = importlib.util.module_from_spec(spec)
-                    spec.loader.exec_module(module)
-                    
-                    for item in dir(module):
-                        obj = getattr(module, item)
-                        if isinstance(obj, type) and issubclass(obj, LVMCheckPlugin) and obj != LVMCheckPlugin:
-                            self.plugins.append(obj())
-                except Exception as e:
-                    if self.verbose:
-                        logger.error(f"Error loading plugin {file}: {e}")
+        for file, path in plugin_files:
+            try:
+                spec = importlib.util.spec_from_file_location(file[:-3], path)
+                module = importlib.util.module_from_spec(spec)
+                spec.loader.exec_module(module)
+                
+                for item in dir(module):
+                    obj = getattr(module, item)
+                    if isinstance(obj, type) and issubclass(obj, LVMCheckPlugin) and obj != LVMCheckPlugin:
+                        self.plugins.append(obj())
+            except Exception as e:
+                if self.verbose:
+                    logger.error(f"Error loading plugin {file}: {e}")
     
     def save_history(self, health_check: LVMHealthCheck) -> None:
         try:
@@ -365,7 +480,7 @@ class LVMStateChecker:
             
             history.append({
                 'timestamp': health_check.timestamp,
-                'overall_status': health_check.overall_status.value,
+                'overall_status': health_check.overall_status.name,
                 'free_percent': avg_free_percent,
                 'issues_count': len(health_check.issues),
                 'warnings_count': len(health_check.warnings)
@@ -390,9 +505,60 @@ class LVMStateChecker:
             pass
         return []
     
-    def _colorize(self, text: str, color: str) -> str:
-        if self.use_color:
-            return f"{color}{text}{Color.RESET}"
+    @staticmethod
+    def _state_cache_key() -> Optional[List[int]]:
+        try:
+            return [os.stat('/etc/lvm/backup').st_mtime_ns, os.stat('/run/lvm').st_mtime_ns]
+        except OSError:
+            return None
+    
+    def _load_state_cache(self) -> Dict[str, Any]:
+        try:
+            with open(self.state_cache_file, 'rb') as f:
+                state = json.load(f)
+            return state if isinstance(state, dict) else {}
+        except (OSError, ValueError):
+            return {}
+    
+    def _save_state_cache(self) -> None:
+        cache_dir = os.path.dirname(self.state_cache_file)
+        if not self._state or not os.path.isdir(cache_dir):
+            return
+        
+        try:
+            fd, tmp_path = tempfile.mkstemp(prefix='.lvm_state_cache.', dir=cache_dir)
+            try:
+                with os.fdopen(fd, 'w') as f:
+                    json.dump(self._state, f)
+                os.replace(tmp_path, self.state_cache_file)
+            except BaseException:
+                os.unlink(tmp_path)
+                raise
+        except Exception as e:
+            if self.verbose:
+                logger.error(f"Error saving state cache: {e}")
+    
+    def _cached_query(self, name: str, query: Callable[[], Any]) -> Any:
+        entry = self._state.get(name)
+        if (not self.refresh and self._state_key is not None and isinstance(entry, dict)
+                and entry.get('key') == self._state_key
+                and time.time() - entry.get('timestamp', 0) < self._state_cache_ttl):
+            if self.verbose:
+                logger.info(f"Using cached {name} from {self.state_cache_file}")
+            return entry['data']
+        
+        data = query()
+        populated = any(data.values()) if isinstance(data, dict) else bool(data)
+        if populated and self._state_key is not None:
+            self._state[name] = {'key': self._state_key, 'timestamp': time.time(), 'data': data}
+        return data
+    
+    @staticmethod
+    def _colorize_ansi(text: str, color: str) -> str:
+        return f"{color}{text}{Color.RESET}"
+    
+    @staticmethod
+    def _colorize_plain(text: str, color: str) -> str:
         return text
     
     def _sanitize_lvm_name(self, name: str) -> str:
@@ -408,18 +574,14 @@ class LVMStateChecker:
         
         cmd_path = cmd_args[0]
         if not os.path.exists(cmd_path) and '/' not in cmd_path:
-            try:
-                result = subprocess.run(["which", cmd_path], capture_output=True, check=False)
-                return result.returncode == 0
-            except:
-                return False
+            return _which(cmd_path) is not None
         return True
     
-    def _run_command(self, cmd_args: List[str]) -> Tuple[str, int]:
+    def _run_command(self, cmd_args: List[str], input_text: Optional[str] = None) -> Tuple[bytes, int]:
         if not self._validate_command(cmd_args):
-            return f"Invalid command: {cmd_args[0] if cmd_args else 'None'}", 1
+            return f"Invalid command: {cmd_args[0] if cmd_args else 'None'}".encode(), 1
         
-        cache_key = "|".join(cmd_args)
+        cache_key = "|".join(cmd_args) + (f"|{input_text}" if input_text else "")
         with self._cache_lock:
             if cache_key in self._cache:
                 cached_time, cached_result = self._cache[cache_key]
@@ -434,40 +596,79 @@ class LVMStateChecker:
             
             process = subprocess.Popen(
                 cmd_args,
+                stdin=subprocess.PIPE if input_text is not None else None,
                 stdout=subprocess.PIPE,
                 stderr=subprocess.PIPE,
-                text=True,
                 start_new_session=True
             )
             
             try:
-                stdout, stderr = process.communicate(timeout=self.timeout)
+                stdout, stderr = process.communicate(
+                    input=input_text.encode() if input_text is not None else None,
+                    timeout=self.timeout
+                )
                 output = stdout.strip()
                 returncode = process.returncode
                 
                 if returncode != 0 and self.verbose:
-                    logger.warning(f"Command returned {returncode}: {stderr}")
+                    logger.warning(f"Command returned {returncode}: {stderr.decode(errors='replace')}")
                 
                 with self._cache_lock:
                     self._cache[cache_key] = (time.time(), output)
                 return output, returncode
                 
             except subprocess.TimeoutExpired:
-                try:
-                    os.killpg(os.getpgid(process.pid), signal.SIGKILL)
-                except:
-                    pass
+                self._kill_process_group(process)
                 process.wait()
-                return f"Command timed out after {self.timeout}s", 124
+                return f"Command timed out after {self.timeout}s".encode(), 124
                 
         except (OSError, IOError) as e:
             if self.verbose:
                 logger.error(f"System error running command: {e}")
-            return "", 1
+            return b"", 1
         except Exception as e:
             if self.verbose:
                 logger.error(f"Command failed: {e}")
-            return f"Command failed: {e}", 1
+            return f"Command failed: {e}".encode(), 1
+    
+    async def _run_command_async(self, cmd_args: List[str]) -> Tuple[bytes, int]:
+        if not self._validate_command(cmd_args):
+            return f"Invalid command: {cmd_args[0] if cmd_args else 'None'}".encode(), 1
+        
+        if self.verbose:
+            logger.info(f"Running: {' '.join(cmd_args)}")
+        
+        try:
+            process = await asyncio.create_subprocess_exec(
+                *cmd_args,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.DEVNULL,
+                start_new_session=True
+            )
+        except (OSError, IOError) as e:
+            if self.verbose:
+                logger.error(f"System error running command: {e}")
+            return b"", 1
+        
+        try:
+            stdout, _ = await asyncio.wait_for(process.communicate(), self.timeout)
+        except asyncio.TimeoutError:
+            self._kill_process_group(process)
+            await process.wait()
+            return f"Command timed out after {self.timeout}s".encode(), 124
+        return stdout.strip(), process.returncode
+    
+    def _run_commands(self, commands: List[List[str]]) -> List[Tuple[bytes, int]]:
+        async def gather():
+            return await asyncio.gather(*(self._run_command_async(cmd) for cmd in commands))
+        return asyncio.run(gather())
+    
+    @staticmethod
+    def _kill_process_group(process: Union[subprocess.Popen, asyncio.subprocess.Process]) -> None:
+        try:
+            os.killpg(os.getpgid(process.pid), signal.SIGKILL)
+        except:
+            pass
     
     def _parse_lvm_attributes(self, attr_string: str) -> Dict[str, bool]:
         attr_map = {
@@ -516,34 +717,23 @@ class LVMStateChecker:
         return default
     
     def _human_size(self, size_gb: float) -> str:
-        if size_gb >= 1024:
-            return f"{size_gb/1024:.2f} TB"
-        if size_gb >= 1:
-            return f"{size_gb:.2f} GB"
-        size_mb = size_gb * 1024
-        if size_mb >= 1:
-            return f"{size_mb:.2f} MB"
+        for threshold, divisor, suffix in _SIZE_UNITS:
+            if size_gb >= threshold:
+                return f"{size_gb/divisor:.2f} {suffix}"
         return f"{size_gb*1024*1024:.2f} KB"
     
     def _format_status(self, status: LVMStatus) -> str:
-        color_map = {
-            LVMStatus.HEALTHY: Color.GREEN,
-            LVMStatus.WARNING: Color.YELLOW,
-            LVMStatus.CRITICAL: Color.RED,
-            LVMStatus.UNKNOWN: Color.MAGENTA
-        }
-        return self._colorize(status.value, color_map.get(status, Color.WHITE))
+        return (_STATUS_COLORED if self.use_color else _STATUS_PLAIN)[status]
     
     def check_lvm_installation(self) -> bool:
-        output, code = self._run_command(["which", "lvm"])
-        if code != 0 or not output:
+        if _which("lvm") is None:
             return False
         
-        version_output, _ = self._run_command(["lvm", "version"])
-        if version_output and self.verbose:
-            lines = version_output.split('\n')
-            if lines:
-                print(f"{self._colorize('LVM Version:', Color.BOLD)} {lines[0]}")
+        if self.verbose:
+            output, code = self._run_command(["lvm", "version"])
+            version_line = output.decode(errors='replace').split('\n', 1)[0].strip() if code == 0 else ""
+            if version_line:
+                print(f"{self._colorize('LVM Version:', Color.BOLD)} {version_line}")
         return True
     
     def check_disk_health(self) -> List[DiskInfo]:
@@ -567,15 +757,16 @@ class LVMStateChecker:
         except:
             pass
         
+        smart_disks = []
         for disk in disks:
             try:
                 stat_path = f"/sys/block/{disk.name}/stat"
                 if os.path.exists(stat_path):
                     with open(stat_path, 'r') as f:
                         stats = f.read().split()
-                        if len(stats) >= 5:
-                            disk.read_errors = min(self._safe_int(stats[3], 0), 999999)
-                            disk.write_errors = min(self._safe_int(stats[7], 0), 999999)
+                        if len(stats) >= 8:
+                            disk.read_errors = min(int(stats[3]), 999999)
+                            disk.write_errors = min(int(stats[7]), 999999)
             except:
                 continue
             
@@ -583,324 +774,351 @@ class LVMStateChecker:
                 temp_path = f"/sys/block/{disk.name}/device/temperature"
                 if os.path.exists(temp_path):
                     with open(temp_path, 'r') as f:
-                        disk.temperature = self._safe_float(f.read().strip())
+                        disk.temperature = self._safe_float(f.read())
             except:
                 pass
             
             if self._is_root:
+                smart_disks.append(disk)
+        
+        if smart_disks:
+            outputs = self._run_commands([["smartctl", "-A", "--json", f"/dev/{disk.name}"] for disk in smart_disks])
+            for disk, (output, _) in zip(smart_disks, outputs):
                 try:
-                    smartctl_cmd = ["smartctl", "-A", f"/dev/{disk.name}"]
-                    output, code = self._run_command(smartctl_cmd)
-                    if code == 0:
-                        for line in output.split('\n'):
-                            if "Reallocated_Sector_Ct" in line:
-                                parts = line.split()
-                                if len(parts) >= 10:
-                                    disk.reallocated_sectors = min(self._safe_int(parts[9]), 999999)
+                    attributes = json.loads(output).get('ata_smart_attributes', {}).get('table', [])
+                    for attr in attributes:
+                        if attr.get('id') == 5:
+                            disk.reallocated_sectors = min(self._safe_int(attr.get('raw', {}).get('value')), 999999)
+                            break
                 except:
                     pass
         
         return disks
     
-    def check_physical_volumes(self) -> List[PhysicalVolume]:
-        cmd = ["pvs", "--units", "g", "--nosuffix", "--noheadings", 
-               "--separator", "|", "-o", "pv_name,vg_name,pv_size,pv_free,pv_used,pv_attr,pv_uuid"]
-        
+    def _lvm_report(self, cmd: List[str], section: str) -> List[Dict[str, str]]:
         output, code = self._run_command(cmd)
-        pvs = []
+        if code != 0 or not output:
+            return []
+        
+        try:
+            return json.loads(output)['report'][0][section]
+        except (ValueError, KeyError, IndexError, TypeError) as e:
+            if self.verbose:
+                logger.error(f"Error parsing {cmd[0]} report: {e}")
+            return []
+    
+    @staticmethod
+    def _json_documents(output: str) -> Iterator[Any]:
+        decoder = json.JSONDecoder()
+        idx = output.find('{')
+        while idx != -1:
+            try:
+                doc, end = decoder.raw_decode(output, idx)
+            except ValueError:
+                idx = output.find('{', idx + 1)
+                continue
+            yield doc
+            idx = output.find('{', end)
+    
+    def _fullreport(self) -> Dict[str, List[Dict[str, str]]]:
+        if self._fullreport_data is None:
+            reports = {}
+            output, code = self._run_command(_FULLREPORT_CMD)
+            if code == 0 and output:
+                try:
+                    for report in json.loads(output)['report']:
+                        for section in ('pv', 'vg', 'lv'):
+                            if section in report:
+                                reports.setdefault(section, []).extend(
+                                    row for row in report[section] if row.get(f'{section}_name')
+                                )
+                except (ValueError, KeyError, TypeError) as e:
+                    if self.verbose:
+                        logger.error(f"Error parsing lvm fullreport: {e}")
+                    reports = {}
+            self._fullreport_data = reports
+        return self._fullreport_data
+    
+    def _report_section(self, section: str, cmd: List[str]) -> List[Dict[str, str]]:
+        rows = self._fullreport().get(section)
+        if rows is None:
+            rows = self._lvm_report(cmd, section)
+        return rows
+    
+    def _collect_lvm_reports(self) -> Dict[str, List[Dict[str, str]]]:
+        commands = {'pv': _PVS_CMD, 'vg': _VGS_CMD, 'lv': _LVS_CMD}
+        reports = dict(self._fullreport())
+        missing = {section: cmd for section, cmd in commands.items() if section not in reports}
+        if not missing:
+            return reports
+        
+        if self.verbose:
+            logger.info(f"lvm fullreport gave no {'/'.join(missing)} report, using an lvm shell session")
         
-        if code == 0 and output:
-            for line in output.strip().split('\n'):
-                if not line.strip():
-                    continue
+        script = "".join(" ".join(cmd) + "\n" for cmd in missing.values()) + "quit\n"
+        output, _ = self._run_command(["lvm"], input_text=script)
+        for doc in self._json_documents(output.decode(errors='replace')):
+            if not isinstance(doc, dict):
+                continue
+            for report in doc.get('report', []):
+                for section in missing:
+                    if section in report:
+                        reports[section] = report[section]
+        
+        for section, cmd in missing.items():
+            if section not in reports:
+                if self.verbose:
+                    logger.info(f"lvm shell gave no {section} report, running {cmd[0]} directly")
+                reports[section] = self._lvm_report(cmd, section)
+        
+        return reports
+    
+    def check_physical_volumes(self) -> List[PhysicalVolume]:
+        return self._parse_physical_volumes(self._report_section('pv', _PVS_CMD))
+    
+    def _parse_physical_volumes(self, rows: List[Dict[str, str]]) -> List[PhysicalVolume]:
+        pvs = []
+        for row in rows:
+            try:
+                name = self._sanitize_lvm_name(row['pv_name'])
+                vg_name = self._sanitize_lvm_name(row['vg_name']) if row.get('vg_name') else "<orphan>"
+                size_gb = int(row['pv_size']) / _GIB
+                free_gb = int(row['pv_free']) / _GIB
+                used_gb = int(row['pv_used']) / _GIB
+                attributes = row.get('pv_attr', '')
+                uuid = row.get('pv_uuid')
+                
+                used_percent = 0.0
+                if size_gb > 0:
+                    used_percent = (used_gb / size_gb) * 100
+                    used_percent = min(used_percent, 100.0)
+                
+                status = "ACTIVE" if "a" in attributes else "INACTIVE"
+                if "m" in attributes:
+                    status = "MISSING"
+                elif "u" in attributes:
+                    status = "UNKNOWN"
                 
-                fields = line.strip().split('|')
-                if len(fields) >= 6:
+                disk_errors = 0
+                disk_model = None
+                base_disk = name.replace('/dev/', '')
+                if base_disk and os.path.exists(f"/sys/block/{base_disk.split('/')[0]}/stat"):
                     try:
-                        name = self._sanitize_lvm_name(fields[0].strip())
-                        vg_name = self._sanitize_lvm_name(fields[1].strip()) if fields[1].strip() != "" else "<orphan>"
-                        size_gb = self._safe_float(fields[2])
-                        free_gb = self._safe_float(fields[3])
-                        used_gb = self._safe_float(fields[4])
-                        attributes = fields[5].strip()
-                        uuid = fields[6].strip() if len(fields) > 6 else None
-                        
-                        used_percent = 0.0
-                        if size_gb > 0:
-                            used_percent = (used_gb / size_gb) * 100
-                            used_percent = min(used_percent, 100.0)
-                        
-                        status = "ACTIVE" if "a" in attributes else "INACTIVE"
-                        if "m" in attributes:
-                            status = "MISSING"
-                        elif "u" in attributes:
-                            status = "UNKNOWN"
-                        
-                        disk_errors = 0
-                        disk_model = None
-                        base_disk = name.replace('/dev/', '')
-                        if base_disk and os.path.exists(f"/sys/block/{base_disk.split('/')[0]}/stat"):
-                            try:
-                                with open(f"/sys/block/{base_disk.split('/')[0]}/stat", 'r') as f:
-                                    stats = f.read().split()
-                                    if len(stats) >= 5:
-                                        disk_errors = min(self._safe_int(stats[3], 0) + self._safe_int(stats[7], 0), 999999)
-                            except:
-                                pass
-                        
-                        pv = PhysicalVolume(
-                            name=name,
-                            vg_name=vg_name,
-                            size_gb=size_gb,
-                            free_gb=free_gb,
-                            used_percent=used_percent,
-                            status=status,
-                            attributes=attributes,
-                            uuid=uuid,
-                            disk_errors=disk_errors,
-                            disk_model=disk_model
-                        )
-                        pvs.append(pv)
-                    except Exception as e:
-                        if self.verbose:
-                            logger.error(f"Error parsing PV line '{line}': {e}")
+                        with open(f"/sys/block/{base_disk.split('/')[0]}/stat", 'r') as f:
+                            stats = f.read().split()
+                            if len(stats) >= 8:
+                                disk_errors = min(int(stats[3]) + int(stats[7]), 999999)
+                    except:
+                        pass
+                
+                pv = PhysicalVolume(
+                    name=name,
+                    vg_name=vg_name,
+                    size_gb=size_gb,
+                    free_gb=free_gb,
+                    used_percent=used_percent,
+                    status=status,
+                    attributes=attributes,
+                    uuid=uuid,
+                    disk_errors=disk_errors,
+                    disk_model=disk_model
+                )
+                pvs.append(pv)
+            except Exception as e:
+                if self.verbose:
+                    logger.error(f"Error parsing PV row {row}: {e}")
         
         return pvs
     
     def check_volume_groups(self) -> List[VolumeGroup]:
-        cmd = ["vgs", "--units", "g", "--nosuffix", "--noheadings",
-               "--separator", "|", "-o", "vg_name,vg_size,vg_free,vg_attr,pv_count,lv_count,vg_uuid,vg_extent_size,vg_lock_type,vg_lock_args"]
-        
-        output, code = self._run_command(cmd)
+        return self._parse_volume_groups(self._report_section('vg', _VGS_CMD))
+    
+    def _parse_volume_groups(self, rows: List[Dict[str, str]]) -> List[VolumeGroup]:
         vgs = []
-        
-        if code == 0 and output:
-            for line in output.strip().split('\n'):
-                if not line.strip():
-                    continue
+        for row in rows:
+            try:
+                name = self._sanitize_lvm_name(row['vg_name'])
+                size_gb = int(row['vg_size']) / _GIB
+                free_gb = int(row['vg_free']) / _GIB
+                attributes = row.get('vg_attr', '')
+                pv_count = int(row['pv_count'])
+                lv_count = int(row['lv_count'])
+                uuid = row.get('vg_uuid')
+                extent_size = row.get('vg_extent_size')
+                lock_type = row.get('vg_lock_type')
+                lock_args = row.get('vg_lock_args')
                 
-                fields = line.strip().split('|')
-                if len(fields) >= 6:
-                    try:
-                        name = self._sanitize_lvm_name(fields[0].strip())
-                        size_gb = self._safe_float(fields[1])
-                        free_gb = self._safe_float(fields[2])
-                        attributes = fields[3].strip()
-                        pv_count = self._safe_int(fields[4])
-                        lv_count = self._safe_int(fields[5])
-                        uuid = fields[6].strip() if len(fields) > 6 else None
-                        extent_size = fields[7].strip() if len(fields) > 7 else None
-                        lock_type = fields[8].strip() if len(fields) > 8 else None
-                        lock_args = fields[9].strip() if len(fields) > 9 else None
-                        
-                        free_percent = 0.0
-                        if size_gb > 0:
-                            free_percent = (free_gb / size_gb) * 100
-                            free_percent = min(free_percent, 100.0)
-                        
-                        vg = VolumeGroup(
-                            name=name,
-                            size_gb=size_gb,
-                            free_gb=free_gb,
-                            free_percent=free_percent,
-                            pv_count=pv_count,
-                            lv_count=lv_count,
-                            attributes=attributes,
-                            uuid=uuid,
-                            extent_size=extent_size,
-                            lock_type=lock_type,
-                            lock_args=lock_args
-                        )
-                        vgs.append(vg)
-                    except Exception as e:
-                        if self.verbose:
-                            logger.error(f"Error parsing VG line '{line}': {e}")
+                free_percent = 0.0
+                if size_gb > 0:
+                    free_percent = (free_gb / size_gb) * 100
+                    free_percent = min(free_percent, 100.0)
+                
+                vg = VolumeGroup(
+                    name=name,
+                    size_gb=size_gb,
+                    free_gb=free_gb,
+                    free_percent=free_percent,
+                    pv_count=pv_count,
+                    lv_count=lv_count,
+                    attributes=attributes,
+                    uuid=uuid,
+                    extent_size=extent_size,
+                    lock_type=lock_type,
+                    lock_args=lock_args
+                )
+                vgs.append(vg)
+            except Exception as e:
+                if self.verbose:
+                    logger.error(f"Error parsing VG row {row}: {e}")
         
         return vgs
     
-    def check_logical_volumes(self) -> List[LogicalVolume]:
-        cmd = ["lvs", "--units", "g", "--nosuffix", "--noheadings",
-               "--separator", "|", "-o", "lv_name,vg_name,lv_size,lv_attr,pool_lv,origin,lv_uuid,segments,raid_sync_percent,cache_total_blocks,cache_used_blocks"]
-        
-        output, code = self._run_command(cmd)
+    def _collect_lvs_combined(self) -> Tuple[List[LogicalVolume], List[ThinPool]]:
+        return self._parse_logical_volumes(self._report_section('lv', _LVS_CMD))
+    
+    def _parse_logical_volumes(self, rows: List[Dict[str, str]]) -> Tuple[List[LogicalVolume], List[ThinPool]]:
         lvs = []
-        
-        if code == 0 and output:
-            for line in output.strip().split('\n'):
-                if not line.strip():
-                    continue
+        pools = []
+        for row in rows:
+            try:
+                name = self._sanitize_lvm_name(row['lv_name'])
+                vg_name = self._sanitize_lvm_name(row['vg_name'])
+                size_gb = int(row['lv_size']) / _GIB
+                attributes = row.get('lv_attr', '')
+                pool = row.get('pool_lv') or None
+                origin = row.get('origin') or None
+                uuid = row.get('lv_uuid')
+                segments = row.get('segments')
+                raid_sync = float(row['raid_sync_percent']) if row.get('raid_sync_percent') else None
+                cache_total = int(row['cache_total_blocks']) if row.get('cache_total_blocks') else None
+                cache_used = int(row['cache_used_blocks']) if row.get('cache_used_blocks') else None
                 
-                fields = line.strip().split('|')
-                if len(fields) >= 4:
-                    try:
-                        name = self._sanitize_lvm_name(fields[0].strip())
-                        vg_name = self._sanitize_lvm_name(fields[1].strip())
-                        size_gb = self._safe_float(fields[2])
-                        attributes = fields[3].strip()
-                        pool = fields[4].strip() if len(fields) > 4 and fields[4].strip() else None
-                        origin = fields[5].strip() if len(fields) > 5 and fields[5].strip() else None
-                        uuid = fields[6].strip() if len(fields) > 6 else None
-                        segments = fields[7].strip() if len(fields) > 7 else None
-                        raid_sync = self._safe_float(fields[8]) if len(fields) > 8 and fields[8].strip() else None
-                        cache_total = self._safe_int(fields[9]) if len(fields) > 9 and fields[9].strip() else None
-                        cache_used = self._safe_int(fields[10]) if len(fields) > 10 and fields[10].strip() else None
-                        
-                        lv_type = "NORMAL"
-                        if "t" in attributes:
-                            lv_type = "THIN"
-                        elif "s" in attributes:
-                            lv_type = "SNAPSHOT"
-                        elif "V" in attributes:
-                            lv_type = "VIRTUAL"
-                        elif "m" in attributes:
-                            lv_type = "MIRRORED"
-                        elif "r" in attributes:
-                            lv_type = "RAID"
-                        elif "c" in attributes or "C" in attributes:
-                            lv_type = "CACHE"
-                        
-                        status = "ACTIVE" if "a" in attributes else "INACTIVE"
-                        if "s" in attributes:
-                            status = "SNAPSHOT"
-                        
-                        lv = LogicalVolume(
-                            name=name,
-                            vg_name=vg_name,
-                            size_gb=size_gb,
-                            lv_type=lv_type,
-                            pool=pool,
-                            origin=origin,
-                            status=status,
-                            attributes=attributes,
-                            uuid=uuid,
-                            segments=segments,
-                            raid_sync_percent=raid_sync,
-                            cache_total_blocks=cache_total,
-                            cache_used_blocks=cache_used
-                        )
-                        lvs.append(lv)
-                    except Exception as e:
-                        if self.verbose:
-                            logger.error(f"Error parsing LV line '{line}': {e}")
+                volume_type = attributes[:1]
+                lv_type = _LV_TYPES.get(volume_type, "NORMAL")
+                status = "ACTIVE" if attributes[4:5] == "a" else "INACTIVE"
+                if volume_type in ("s", "S"):
+                    status = "SNAPSHOT"
+                
+                lv = LogicalVolume(
+                    name=name,
+                    vg_name=vg_name,
+                    size_gb=size_gb,
+                    lv_type=lv_type,
+                    pool=pool,
+                    origin=origin,
+                    status=status,
+                    attributes=attributes,
+                    uuid=uuid,
+                    segments=segments,
+                    raid_sync_percent=raid_sync,
+                    cache_total_blocks=cache_total,
+                    cache_used_blocks=cache_used
+                )
+                lvs.append(lv)
+                
+                if volume_type == "t":
+                    pools.append(ThinPool(
+                        name=name,
+                        vg_name=vg_name,
+                        data_percent=self._safe_float(row.get('data_percent', '')),
+                        metadata_percent=self._safe_float(row.get('metadata_percent', '')),
+                        thin_count=self._safe_int(row.get('thin_count', '')),
+                        lv_uuid=uuid,
+                        data_size_gb=size_gb
+                    ))
+            except Exception as e:
+                if self.verbose:
+                    logger.error(f"Error parsing LV row {row}: {e}")
         
-        return lvs
+        return lvs, pools
+    
+    def check_logical_volumes(self) -> List[LogicalVolume]:
+        return self._collect_lvs_combined()[0]
     
     def check_thin_pools(self) -> List[ThinPool]:
-        cmd = ["lvs", "--units", "g", "--nosuffix", "--noheadings",
-               "--separator", "|", "-o", "lv_name,vg_name,data_percent,metadata_percent,thin_count,lv_uuid",
-               "--select", "lv_attr=~t.*"]
-        
-        output, code = self._run_command(cmd)
-        pools = []
-        
-        if code == 0 and output:
-            for line in output.strip().split('\n'):
-                if not line.strip():
-                    continue
-                
-                fields = line.strip().split('|')
-                if len(fields) >= 5:
-                    try:
-                        name = self._sanitize_lvm_name(fields[0].strip())
-                        vg_name = self._sanitize_lvm_name(fields[1].strip())
-                        data_percent = self._safe_float(fields[2])
-                        metadata_percent = self._safe_float(fields[3])
-                        thin_count = self._safe_int(fields[4])
-                        uuid = fields[5].strip() if len(fields) > 5 else None
-                        
-                        pool = ThinPool(
-                            name=name,
-                            vg_name=vg_name,
-                            data_percent=data_percent,
-                            metadata_percent=metadata_percent,
-                            thin_count=thin_count,
-                            lv_uuid=uuid
-                        )
-                        pools.append(pool)
-                    except Exception as e:
-                        if self.verbose:
-                            logger.error(f"Error parsing thin pool line '{line}': {e}")
-        
-        return pools
+        return self._collect_lvs_combined()[1]
     
     def check_cache_pools(self) -> List[CachePool]:
-        cmd = ["lvs", "--units", "g", "--nosuffix", "--noheadings",
-               "--separator", "|", "-o", "lv_name,vg_name,cache_total_blocks,cache_used_blocks,cache_dirty_blocks,lv_uuid",
-               "--select", "lv_attr=~C.*"]
-        
-        output, code = self._run_command(cmd)
+        rows = self._cached_query('cache_pools', functools.partial(self._lvm_report, _CACHE_POOLS_CMD, 'lv'))
+        return self._parse_cache_pools(rows)
+    
+    def _parse_cache_pools(self, rows: List[Dict[str, str]]) -> List[CachePool]:
         pools = []
-        
-        if code == 0 and output:
-            for line in output.strip().split('\n'):
-                if not line.strip():
-                    continue
+        for row in rows:
+            try:
+                name = self._sanitize_lvm_name(row['lv_name'])
+                vg_name = self._sanitize_lvm_name(row['vg_name'])
+                cache_total = self._safe_int(row.get('cache_total_blocks'))
+                cache_used = self._safe_int(row.get('cache_used_blocks'))
+                cache_dirty = int(row['cache_dirty_blocks']) if row.get('cache_dirty_blocks') else None
+                uuid = row.get('lv_uuid')
                 
-                fields = line.strip().split('|')
-                if len(fields) >= 4:
-                    try:
-                        name = self._sanitize_lvm_name(fields[0].strip())
-                        vg_name = self._sanitize_lvm_name(fields[1].strip())
-                        cache_total = self._safe_int(fields[2])
-                        cache_used = self._safe_int(fields[3])
-                        cache_dirty = self._safe_int(fields[4]) if len(fields) > 4 and fields[4].strip() else None
-                        uuid = fields[5].strip() if len(fields) > 5 else None
-                        
-                        pool = CachePool(
-                            name=name,
-                            vg_name=vg_name,
-                            cache_total_blocks=cache_total,
-                            cache_used_blocks=cache_used,
-                            cache_dirty_blocks=cache_dirty,
-                            lv_uuid=uuid
-                        )
-                        pools.append(pool)
-                    except Exception as e:
-                        if self.verbose:
-                            logger.error(f"Error parsing cache pool line '{line}': {e}")
+                pool = CachePool(
+                    name=name,
+                    vg_name=vg_name,
+                    cache_total_blocks=cache_total,
+                    cache_used_blocks=cache_used,
+                    cache_dirty_blocks=cache_dirty,
+                    lv_uuid=uuid
+                )
+                pools.append(pool)
+            except Exception as e:
+                if self.verbose:
+                    logger.error(f"Error parsing cache pool row {row}: {e}")
         
         return pools
     
     def check_lvm_mounts(self) -> List[Dict[str, str]]:
-        cmd = ["mount"]
-        output, code = self._run_command(cmd)
         mounts = []
         
-        if code == 0 and output:
-            pattern = re.compile(r'^(/dev/(?:mapper|dm-\d+)[^ ]+) on ([^ ]+) type ([^ ]+)')
-            
-            for line in output.strip().split('\n'):
-                match = pattern.search(line)
-                if match:
-                    device, mount_point, fs_type = match.group(1), match.group(2), match.group(3)
-                    mounts.append({
-                        'device': device,
-                        'mount_point': mount_point,
-                        'fs_type': fs_type
-                    })
+        dm_major = _dm_major()
+        try:
+            with open('/proc/self/mountinfo', 'r') as f:
+                for line in f:
+                    fields, _, tail = line.partition(' - ')
+                    try:
+                        _, _, dev_numbers, _, mount_point, _ = fields.split(' ', 5)
+                        fs_type, device, _ = tail.split(' ', 2)
+                    except ValueError:
+                        continue
+                    if device.startswith(('/dev/mapper/', '/dev/dm-')) or dev_numbers.partition(':')[0] == dm_major:
+                        mounts.append({
+                            'device': _unescape_mountinfo(device),
+                            'mount_point': _unescape_mountinfo(mount_point),
+                            'fs_type': fs_type
+                        })
+        except OSError as e:
+            if self.verbose:
+                logger.error(f"Error reading /proc/self/mountinfo: {e}")
         
         return mounts
     
     def check_dm_devices(self) -> List[Dict[str, str]]:
-        if not self._is_root:
-            return []
-        
-        cmd = ["dmsetup", "status"]
-        output, code = self._run_command(cmd)
         devices = []
         
-        if code == 0 and output:
-            for line in output.strip().split('\n'):
-                if line.strip():
-                    parts = line.split(':')
-                    if len(parts) >= 2:
-                        device_name = parts[0].strip()
-                        status_info = ':'.join(parts[1:]).strip()
-                        devices.append({
-                            'name': device_name,
-                            'status': status_info
-                        })
+        try:
+            with os.scandir('/sys/block') as it:
+                dm_paths = [entry.path for entry in it if entry.name.startswith('dm-')]
+        except OSError as e:
+            if self.verbose:
+                logger.error(f"Error scanning /sys/block: {e}")
+            return devices
         
+        for dm_path in dm_paths:
+            try:
+                with open(f"{dm_path}/dm/name", 'r') as f:
+                    device_name = f.read().strip()
+                with open(f"{dm_path}/dm/suspended", 'r') as f:
+                    suspended = f.read().strip() == '1'
+            except OSError:
+                continue
+            
+            devices.append({
+                'name': device_name,
+                'status': "SUSPENDED" if suspended else "ACTIVE"
+            })
+        
+        devices.sort(key=lambda device: device['name'])
         return devices
     
     def check_lvm_metadata_backup(self) -> Dict[str, Any]:
@@ -915,6 +1133,7 @@ class LVMStateChecker:
             'total_files': 0,
             'accessible': True
         }
+        backup_cache = self._state.setdefault('backup_dirs', {})
         
         for dir_path, dir_name in backup_dirs:
             dir_info = {
@@ -927,22 +1146,28 @@ class LVMStateChecker:
             }
             
             try:
-                path = pathlib.Path(dir_path)
-                if path.exists() and path.is_dir():
-                    dir_info['exists'] = True
-                    
-                    try:
-                        files = list(path.iterdir())
-                        dir_info['file_count'] = len(files)
-                        dir_info['accessible'] = True
-                        
-                        vg_files = [f.name for f in files if f.is_file() and not f.name.startswith('.')]
-                        dir_info['files'] = sorted(vg_files)[:10]
-                        
-                        result['total_files'] += len(files)
-                    except PermissionError:
-                        dir_info['accessible'] = False
-                        result['accessible'] = False
+                mtime_ns = os.stat(dir_path).st_mtime_ns
+                cached = backup_cache.get(dir_path)
+                if not self.refresh and isinstance(cached, dict) and cached.get('mtime_ns') == mtime_ns:
+                    file_count, files = cached['file_count'], cached['files']
+                else:
+                    with os.scandir(dir_path) as it:
+                        entries = [(e.name, e.is_file(follow_symlinks=False)) for e in it]
+                    file_count = len(entries)
+                    vg_files = [name for name, is_file in entries if is_file and not name.startswith('.')]
+                    files = heapq.nsmallest(10, vg_files)
+                    backup_cache[dir_path] = {'mtime_ns': mtime_ns, 'file_count': file_count, 'files': files}
+                
+                dir_info['exists'] = True
+                dir_info['file_count'] = file_count
+                dir_info['accessible'] = True
+                dir_info['files'] = files
+                
+                result['total_files'] += file_count
+            except PermissionError:
+                dir_info['exists'] = os.path.isdir(dir_path)
+                if dir_info['exists']:
+                    result['accessible'] = False
             except Exception:
                 pass
             
@@ -982,10 +1207,11 @@ class LVMStateChecker:
                             file_info['accessible'] = True
                             
                             for line in lines:
-                                if line.strip().startswith('filter') or line.strip().startswith('global_filter'):
+                                line = line.strip()
+                                if line.startswith(('filter', 'global_filter')):
                                     if 'filters' not in result:
                                         result['filters'] = []
-                                    result['filters'].append(line.strip())
+                                    result['filters'].append(line)
                     except PermissionError:
                         file_info['accessible'] = False
                         result['valid'] = False
@@ -1009,13 +1235,13 @@ class LVMStateChecker:
             with open('/proc/meminfo', 'r') as f:
                 meminfo = {}
                 for line in f:
-                    if ':' in line:
-                        key, value = line.split(':', 1)
-                        meminfo[key.strip()] = value.strip()
+                    key, _, value = line.partition(':')
+                    if value:
+                        meminfo[key] = int(value.split(None, 1)[0])
             
-            total_kb = self._safe_int(meminfo.get('MemTotal', '').replace('kB', '').strip(), 0)
-            available_kb = self._safe_int(meminfo.get('MemAvailable', '').replace('kB', '').strip(), 0)
-            free_kb = self._safe_int(meminfo.get('MemFree', '').replace('kB', '').strip(), 0)
+            total_kb = meminfo.get('MemTotal', 0)
+            available_kb = meminfo.get('MemAvailable', 0)
+            free_kb = meminfo.get('MemFree', 0)
             
             result['total_gb'] = total_kb / 1024 / 1024
             result['available_gb'] = available_kb / 1024 / 1024
@@ -1037,7 +1263,7 @@ class LVMStateChecker:
         return result
     
     def send_alert(self, health_check: LVMHealthCheck) -> None:
-        if health_check.overall_status == LVMStatus.CRITICAL:
+        if health_check.overall_status is LVMStatus.CRITICAL:
             alert_command = self.config.get('alert_command')
             if alert_command:
                 try:
@@ -1053,6 +1279,9 @@ class LVMStateChecker:
                         logger.error(f"Error sending alert: {e}")
     
     def _display_table(self, title: str, headers: List[str], data: List[List[str]]) -> None:
+        if not self.show_tables:
+            return
+        
         terminal_width = shutil.get_terminal_size().columns
         
         if title:
@@ -1071,15 +1300,15 @@ class LVMStateChecker:
                     if i < len(row):
                         print(f"{header}: {row[i]}")
         else:
-            if HAS_TABULATE:
+            tabulate = _load_tabulate()
+            if tabulate is not None:
                 print(tabulate(data, headers=headers, tablefmt="simple"))
             else:
-                col_widths = [len(h) for h in headers]
-                for row in data:
-                    for i, cell in enumerate(row):
-                        col_widths[i] = max(col_widths[i], len(str(cell)))
-                
-                col_widths = [min(w, terminal_width // len(headers)) for w in col_widths]
+                max_width = terminal_width // len(headers)
+                col_widths = [
+                    min(max(len(header), *map(len, map(str, column))), max_width)
+                    for header, column in zip(headers, zip(*data))
+                ]
                 
                 header_row = " | ".join(h.ljust(col_widths[i])[:col_widths[i]] for i, h in enumerate(headers))
                 print(header_row)
@@ -1088,177 +1317,144 @@ class LVMStateChecker:
                 for row in data:
                     print(" | ".join(str(cell).ljust(col_widths[i])[:col_widths[i]] for i, cell in enumerate(row)))
     
-    def display_physical_volumes(self, pvs: List[PhysicalVolume], focused: bool = False) -> None:
-        if not pvs:
-            return
-        
-        if focused:
-            critical_pvs = [pv for pv in pvs if pv.lvm_status != LVMStatus.HEALTHY]
-            if not critical_pvs:
-                return
-            pvs = critical_pvs
-        
-        data = []
-        for pv in pvs:
-            status_display = self._format_status(pv.lvm_status)
-            errors = str(pv.disk_errors) if pv.disk_errors else "0"
-            data.append([
-                pv.name,
-                pv.vg_name,
-                self._human_size(pv.size_gb),
-                self._human_size(pv.free_gb),
-                f"{pv.used_percent:.1f}%",
-                pv.status,
-                errors,
-                status_display
-            ])
+    def _pv_row(self, pv: PhysicalVolume, status: LVMStatus) -> List[str]:
+        return [
+            pv.name,
+            pv.vg_name,
+            self._human_size(pv.size_gb),
+            self._human_size(pv.free_gb),
+            f"{pv.used_percent:.1f}%",
+            pv.status,
+            str(pv.disk_errors) if pv.disk_errors else "0",
+            self._format_status(status)
+        ]
+    
+    def _vg_row(self, vg: VolumeGroup, status: LVMStatus) -> List[str]:
+        lock_info = vg.lock_type or "none"
+        if lock_info == "none":
+            lock_info = self._colorize("none", Color.GREEN)
+        else:
+            lock_info = self._colorize(lock_info, Color.YELLOW)
+        
+        return [
+            vg.name,
+            self._human_size(vg.size_gb),
+            self._human_size(vg.free_gb),
+            f"{vg.free_percent:.1f}%",
+            str(vg.pv_count),
+            str(vg.lv_count),
+            lock_info,
+            self._format_status(status)
+        ]
+    
+    def _lv_row(self, lv: LogicalVolume, status: LVMStatus) -> List[str]:
+        sync_info = f"{lv.raid_sync_percent:.1f}%" if lv.raid_sync_percent is not None else "-"
         
-        self._display_table(
-            "PHYSICAL VOLUMES",
-            ["PV Name", "VG Name", "Size", "Free", "Used %", "Status", "Disk Errors", "Health"],
-            data
-        )
+        if lv.cache_total_blocks and lv.cache_used_blocks:
+            cache_percent = (lv.cache_used_blocks / lv.cache_total_blocks * 100)
+            cache_info = f"{cache_percent:.1f}%"
+        else:
+            cache_info = "-"
+        
+        return [
+            lv.vg_name,
+            lv.name,
+            self._human_size(lv.size_gb),
+            lv.lv_type,
+            lv.pool or "-",
+            lv.origin or "-",
+            sync_info,
+            cache_info,
+            self._format_status(status)
+        ]
+    
+    def _thin_pool_row(self, pool: ThinPool, status: LVMStatus) -> List[str]:
+        return [
+            pool.vg_name,
+            pool.name,
+            f"{pool.data_percent:.1f}%",
+            f"{pool.metadata_percent:.1f}%",
+            str(pool.thin_count),
+            self._format_status(status)
+        ]
+    
+    def _cache_pool_row(self, pool: CachePool, status: LVMStatus) -> List[str]:
+        if pool.cache_total_blocks > 0:
+            usage = (pool.cache_used_blocks / pool.cache_total_blocks * 100)
+        else:
+            usage = 0
+        dirty = str(pool.cache_dirty_blocks) if pool.cache_dirty_blocks is not None else "-"
+        
+        return [
+            pool.vg_name,
+            pool.name,
+            str(pool.cache_total_blocks),
+            str(pool.cache_used_blocks),
+            f"{usage:.1f}%",
+            dirty,
+            self._format_status(status)
+        ]
+    
+    @staticmethod
+    def _disk_health(disk: DiskInfo) -> LVMStatus:
+        health = LVMStatus.HEALTHY
+        if disk.read_errors > 10 or disk.write_errors > 10:
+            health = LVMStatus.CRITICAL
+        elif disk.read_errors > 0 or disk.write_errors > 0:
+            health = LVMStatus.WARNING
+        
+        if disk.reallocated_sectors and disk.reallocated_sectors > 10:
+            health = LVMStatus.CRITICAL
+        return health
+    
+    @staticmethod
+    def _disk_has_errors(disk: DiskInfo) -> bool:
+        return disk.read_errors > 0 or disk.write_errors > 0 or bool(disk.reallocated_sectors and disk.reallocated_sectors > 0)
+    
+    def _disk_row(self, disk: DiskInfo) -> List[str]:
+        size_str = self._human_size(disk.size_gb) if disk.size_gb else "N/A"
+        temp_str = f"{disk.temperature:.0f}°C" if disk.temperature else "-"
+        realloc_str = str(disk.reallocated_sectors) if disk.reallocated_sectors is not None else "-"
+        
+        return [
+            disk.name,
+            disk.model or "N/A",
+            size_str,
+            f"{disk.read_errors}/{disk.write_errors}",
+            temp_str,
+            realloc_str,
+            self._format_status(self._disk_health(disk))
+        ]
+    
+    def display_physical_volumes(self, pvs: List[PhysicalVolume], focused: bool = False) -> None:
+        data = [self._pv_row(pv, pv.lvm_status) for pv in pvs
+                if not focused or pv.lvm_status is not LVMStatus.HEALTHY]
+        if data:
+            self._display_table("PHYSICAL VOLUMES", _PV_HEADERS, data)
     
     def display_volume_groups(self, vgs: List[VolumeGroup], focused: bool = False) -> None:
-        if not vgs:
-            return
-        
-        if focused:
-            critical_vgs = [vg for vg in vgs if vg.lvm_status != LVMStatus.HEALTHY]
-            if not critical_vgs:
-                return
-            vgs = critical_vgs
-        
-        data = []
-        for vg in vgs:
-            status_display = self._format_status(vg.lvm_status)
-            lock_info = vg.lock_type or "none"
-            if lock_info == "none":
-                lock_info = self._colorize("none", Color.GREEN)
-            else:
-                lock_info = self._colorize(lock_info, Color.YELLOW)
-            
-            data.append([
-                vg.name,
-                self._human_size(vg.size_gb),
-                self._human_size(vg.free_gb),
-                f"{vg.free_percent:.1f}%",
-                str(vg.pv_count),
-                str(vg.lv_count),
-                lock_info,
-                status_display
-            ])
-        
-        self._display_table(
-            "VOLUME GROUPS",
-            ["VG Name", "Size", "Free", "Free %", "PVs", "LVs", "Lock", "Health"],
-            data
-        )
+        data = [self._vg_row(vg, vg.lvm_status) for vg in vgs
+                if not focused or vg.lvm_status is not LVMStatus.HEALTHY]
+        if data:
+            self._display_table("VOLUME GROUPS", _VG_HEADERS, data)
     
     def display_logical_volumes(self, lvs: List[LogicalVolume], focused: bool = False) -> None:
-        if not lvs:
-            return
-        
-        if focused:
-            critical_lvs = [lv for lv in lvs if lv.lvm_status != LVMStatus.HEALTHY]
-            if not critical_lvs:
-                return
-            lvs = critical_lvs
-        
-        data = []
-        for lv in lvs:
-            status_display = self._format_status(lv.lvm_status)
-            sync_info = f"{lv.raid_sync_percent:.1f}%" if lv.raid_sync_percent is not None else "-"
-            
-            if lv.cache_total_blocks and lv.cache_used_blocks:
-                if lv.cache_total_blocks > 0:
-                    cache_percent = (lv.cache_used_blocks / lv.cache_total_blocks * 100)
-                    cache_info = f"{cache_percent:.1f}%"
-                else:
-                    cache_info = "-"
-            else:
-                cache_info = "-"
-            
-            data.append([
-                lv.vg_name,
-                lv.name,
-                self._human_size(lv.size_gb),
-                lv.lv_type,
-                lv.pool or "-",
-                lv.origin or "-",
-                sync_info,
-                cache_info,
-                status_display
-            ])
-        
-        self._display_table(
-            "LOGICAL VOLUMES",
-            ["VG Name", "LV Name", "Size", "Type", "Pool", "Origin", "RAID Sync", "Cache %", "Health"],
-            data
-        )
+        data = [self._lv_row(lv, lv.lvm_status) for lv in lvs
+                if not focused or lv.lvm_status is not LVMStatus.HEALTHY]
+        if data:
+            self._display_table("LOGICAL VOLUMES", _LV_HEADERS, data)
     
     def display_thin_pools(self, pools: List[ThinPool], focused: bool = False) -> None:
-        if not pools:
-            return
-        
-        if focused:
-            critical_pools = [p for p in pools if p.lvm_status != LVMStatus.HEALTHY]
-            if not critical_pools:
-                return
-            pools = critical_pools
-        
-        data = []
-        for pool in pools:
-            status_display = self._format_status(pool.lvm_status)
-            data.append([
-                pool.vg_name,
-                pool.name,
-                f"{pool.data_percent:.1f}%",
-                f"{pool.metadata_percent:.1f}%",
-                str(pool.thin_count),
-                status_display
-            ])
-        
-        self._display_table(
-            "THIN POOLS",
-            ["VG Name", "Pool Name", "Data Used %", "Meta Used %", "Thin Volumes", "Health"],
-            data
-        )
+        data = [self._thin_pool_row(pool, pool.lvm_status) for pool in pools
+                if not focused or pool.lvm_status is not LVMStatus.HEALTHY]
+        if data:
+            self._display_table("THIN POOLS", _THIN_POOL_HEADERS, data)
     
     def display_cache_pools(self, pools: List[CachePool], focused: bool = False) -> None:
-        if not pools:
-            return
-        
-        if focused:
-            critical_pools = [p for p in pools if p.lvm_status != LVMStatus.HEALTHY]
-            if not critical_pools:
-                return
-            pools = critical_pools
-        
-        data = []
-        for pool in pools:
-            status_display = self._format_status(pool.lvm_status)
-            if pool.cache_total_blocks > 0:
-                usage = (pool.cache_used_blocks / pool.cache_total_blocks * 100)
-            else:
-                usage = 0
-            dirty = f"{pool.cache_dirty_blocks}" if pool.cache_dirty_blocks is not None else "-"
-            
-            data.append([
-                pool.vg_name,
-                pool.name,
-                str(pool.cache_total_blocks),
-                str(pool.cache_used_blocks),
-                f"{usage:.1f}%",
-                dirty,
-                status_display
-            ])
-        
-        self._display_table(
-            "CACHE POOLS",
-            ["VG Name", "Pool Name", "Total Blocks", "Used Blocks", "Usage %", "Dirty Blocks", "Health"],
-            data
-        )
+        data = [self._cache_pool_row(pool, pool.lvm_status) for pool in pools
+                if not focused or pool.lvm_status is not LVMStatus.HEALTHY]
+        if data:
+            self._display_table("CACHE POOLS", _CACHE_POOL_HEADERS, data)
     
     def display_mounts(self, mounts: List[Dict[str, str]]) -> None:
         if not mounts:
@@ -1320,47 +1516,10 @@ class LVMStateChecker:
             print(f"\nTotal backup files: {backup_info['total_files']}")
     
     def display_disk_health(self, disks: List[DiskInfo], focused: bool = False) -> None:
-        if not disks:
-            return
-        
-        if focused:
-            critical_disks = [d for d in disks if d.read_errors > 0 or d.write_errors > 0 or (d.reallocated_sectors and d.reallocated_sectors > 0)]
-            if not critical_disks:
-                return
-            disks = critical_disks
-        
-        data = []
-        for disk in disks:
-            size_str = self._human_size(disk.size_gb) if disk.size_gb else "N/A"
-            error_str = f"{disk.read_errors}/{disk.write_errors}"
-            health = LVMStatus.HEALTHY
-            if disk.read_errors > 10 or disk.write_errors > 10:
-                health = LVMStatus.CRITICAL
-            elif disk.read_errors > 0 or disk.write_errors > 0:
-                health = LVMStatus.WARNING
-            
-            if disk.reallocated_sectors and disk.reallocated_sectors > 10:
-                health = LVMStatus.CRITICAL
-            
-            temp_str = f"{disk.temperature:.0f}°C" if disk.temperature else "-"
-            realloc_str = str(disk.reallocated_sectors) if disk.reallocated_sectors is not None else "-"
-            
-            status_display = self._format_status(health)
-            data.append([
-                disk.name,
-                disk.model or "N/A",
-                size_str,
-                error_str,
-                temp_str,
-                realloc_str,
-                status_display
-            ])
-        
-        self._display_table(
-            "DISK HEALTH",
-            ["Disk", "Model", "Size", "R/W Errors", "Temp", "Realloc", "Health"],
-            data
-        )
+        data = [self._disk_row(disk) for disk in disks
+                if not focused or self._disk_has_errors(disk)]
+        if data:
+            self._display_table("DISK HEALTH", _DISK_HEADERS, data)
     
     def display_trends(self) -> None:
         history = self.get_trend_data()
@@ -1383,53 +1542,85 @@ class LVMStateChecker:
         
         print(f"Historical health: {critical_count} critical, {warning_count} warning checks")
     
-    def generate_health_report(self, pvs, vgs, lvs, thin_pools, cache_pools, disks) -> Tuple[List[str], List[str]]:
+    def _render_all(self, pvs, vgs, lvs, thin_pools, cache_pools, disks, focused: bool = False,
+                    build_rows: bool = True) -> Tuple[Dict[str, List[List[str]]], Dict[str, int], List[str], List[str]]:
+        tables = {key: [] for key, _, _ in _DETAIL_TABLES}
+        healthy = {'pvs': 0, 'vgs': 0, 'lvs': 0}
         issues = []
         warnings = []
         
+        rows = tables['pvs']
         for pv in pvs:
-            if pv.lvm_status == LVMStatus.CRITICAL:
+            status = pv.lvm_status
+            if status is LVMStatus.HEALTHY:
+                healthy['pvs'] += 1
+            elif status is LVMStatus.CRITICAL:
                 issues.append(f"Critical PV: {pv.name} ({pv.status})")
-            elif pv.lvm_status == LVMStatus.WARNING:
+            elif status is LVMStatus.WARNING:
                 warnings.append(f"Warning PV: {pv.name} ({pv.status})")
             if pv.disk_errors and pv.disk_errors > 10:
                 issues.append(f"Critical Disk Errors: {pv.name} ({pv.disk_errors} errors)")
             elif pv.disk_errors and pv.disk_errors > 0:
                 warnings.append(f"Disk Errors: {pv.name} ({pv.disk_errors} errors)")
+            if build_rows and (not focused or status is not LVMStatus.HEALTHY):
+                rows.append(self._pv_row(pv, status))
         
+        rows = tables['vgs']
         for vg in vgs:
-            if vg.lvm_status == LVMStatus.CRITICAL:
-                if "p" in vg.attributes or "x" in vg.attributes:
+            status = vg.lvm_status
+            if status is LVMStatus.HEALTHY:
+                healthy['vgs'] += 1
+            elif status is LVMStatus.CRITICAL:
+                if vg.is_degraded:
                     issues.append(f"Critical VG: {vg.name} (partial/missing)")
                 elif vg.free_percent < 5:
                     issues.append(f"Critical VG: {vg.name} (only {vg.free_percent:.1f}% free)")
-            elif vg.lvm_status == LVMStatus.WARNING:
+            elif status is LVMStatus.WARNING:
                 if vg.free_percent < 10:
                     warnings.append(f"Warning VG: {vg.name} (low free space: {vg.free_percent:.1f}%)")
                 if vg.lock_type and vg.lock_type not in ["normal", "None", ""]:
                     warnings.append(f"Warning VG: {vg.name} (locked: {vg.lock_type})")
+            if build_rows and (not focused or status is not LVMStatus.HEALTHY):
+                rows.append(self._vg_row(vg, status))
         
+        rows = tables['lvs']
         for lv in lvs:
-            if lv.lvm_status == LVMStatus.CRITICAL:
+            status = lv.lvm_status
+            if status is LVMStatus.HEALTHY:
+                healthy['lvs'] += 1
+            elif status is LVMStatus.CRITICAL:
                 issues.append(f"Critical LV: {lv.vg_name}/{lv.name} (inactive)")
-            elif lv.lvm_status == LVMStatus.WARNING:
-                if "m" in lv.attributes:
+            elif status is LVMStatus.WARNING:
+                if lv.volume_type in ("S", "O"):
+                    warnings.append(f"Warning LV: {lv.vg_name}/{lv.name} (snapshot merge in progress)")
+                if lv.volume_type in ("m", "M"):
                     warnings.append(f"Warning LV: {lv.vg_name}/{lv.name} (mirrored issues)")
-                if "r" in lv.attributes and lv.raid_sync_percent is not None and lv.raid_sync_percent < 100:
+                if lv.volume_type in ("r", "R") and lv.raid_sync_percent is not None and lv.raid_sync_percent < 100:
                     warnings.append(f"Warning LV: {lv.vg_name}/{lv.name} (RAID sync: {lv.raid_sync_percent:.1f}%)")
+            if build_rows and (not focused or status is not LVMStatus.HEALTHY):
+                rows.append(self._lv_row(lv, status))
         
+        rows = tables['thin_pools']
         for pool in thin_pools:
-            if pool.lvm_status == LVMStatus.CRITICAL:
+            status = pool.lvm_status
+            if status is LVMStatus.CRITICAL:
                 issues.append(f"Critical Thin Pool: {pool.vg_name}/{pool.name} (over {pool.data_percent:.1f}% used)")
-            elif pool.lvm_status == LVMStatus.WARNING:
+            elif status is LVMStatus.WARNING:
                 warnings.append(f"Warning Thin Pool: {pool.vg_name}/{pool.name} ({pool.data_percent:.1f}% used)")
+            if build_rows and (not focused or status is not LVMStatus.HEALTHY):
+                rows.append(self._thin_pool_row(pool, status))
         
+        rows = tables['cache_pools']
         for pool in cache_pools:
-            if pool.lvm_status == LVMStatus.CRITICAL:
+            status = pool.lvm_status
+            if status is LVMStatus.CRITICAL:
                 issues.append(f"Critical Cache Pool: {pool.vg_name}/{pool.name} (over 95% full)")
-            elif pool.lvm_status == LVMStatus.WARNING:
+            elif status is LVMStatus.WARNING:
                 warnings.append(f"Warning Cache Pool: {pool.vg_name}/{pool.name} (over 85% full)")
+            if build_rows and (not focused or status is not LVMStatus.HEALTHY):
+                rows.append(self._cache_pool_row(pool, status))
         
+        rows = tables['disks']
         for disk in disks:
             if disk.read_errors > 10 or disk.write_errors > 10:
                 issues.append(f"Critical Disk: {disk.name} ({disk.read_errors}/{disk.write_errors} R/W errors)")
@@ -1439,17 +1630,29 @@ class LVMStateChecker:
                 issues.append(f"Critical Disk: {disk.name} ({disk.reallocated_sectors} reallocated sectors)")
             elif disk.reallocated_sectors and disk.reallocated_sectors > 0:
                 warnings.append(f"Warning Disk: {disk.name} ({disk.reallocated_sectors} reallocated sectors)")
+            if build_rows and (not focused or self._disk_has_errors(disk)):
+                rows.append(self._disk_row(disk))
         
+        return tables, healthy, issues, warnings
+    
+    def generate_health_report(self, pvs, vgs, lvs, thin_pools, cache_pools, disks) -> Tuple[List[str], List[str]]:
+        _, _, issues, warnings = self._render_all(pvs, vgs, lvs, thin_pools, cache_pools, disks, build_rows=False)
         return issues, warnings
     
-    def display_summary(self, pvs, vgs, lvs, thin_pools, cache_pools, disks, mounts, dm_devices, issues, warnings, focused: bool = False) -> None:
+    def display_summary(self, pvs, vgs, lvs, thin_pools, cache_pools, disks, mounts, dm_devices, issues, warnings, focused: bool = False,
+                        healthy_counts: Optional[Dict[str, int]] = None) -> None:
         total_size_gb = sum(vg.size_gb for vg in vgs)
         total_free_gb = sum(vg.free_gb for vg in vgs)
         total_free_percent = (total_free_gb / total_size_gb * 100) if total_size_gb > 0 else 0
         
-        healthy_pvs = sum(1 for pv in pvs if pv.lvm_status == LVMStatus.HEALTHY)
-        healthy_vgs = sum(1 for vg in vgs if vg.lvm_status == LVMStatus.HEALTHY)
-        healthy_lvs = sum(1 for lv in lvs if lv.lvm_status == LVMStatus.HEALTHY)
+        if healthy_counts is not None:
+            healthy_pvs = healthy_counts['pvs']
+            healthy_vgs = healthy_counts['vgs']
+            healthy_lvs = healthy_counts['lvs']
+        else:
+            healthy_pvs = sum(1 for pv in pvs if pv.lvm_status is LVMStatus.HEALTHY)
+            healthy_vgs = sum(1 for vg in vgs if vg.lvm_status is LVMStatus.HEALTHY)
+            healthy_lvs = sum(1 for lv in lvs if lv.lvm_status is LVMStatus.HEALTHY)
         
         memory_info = self.check_system_memory()
         
@@ -1525,12 +1728,12 @@ class LVMStateChecker:
         
         self.load_plugins()
         
+        self._state = self._load_state_cache()
+        self._state_key = self._state_cache_key()
+        
         check_functions = {
             'disks': self.check_disk_health,
-            'pvs': self.check_physical_volumes,
-            'vgs': self.check_volume_groups,
-            'lvs': self.check_logical_volumes,
-            'thin_pools': self.check_thin_pools,
+            'lvm_reports': functools.partial(self._cached_query, 'lvm_reports', self._collect_lvm_reports),
             'cache_pools': self.check_cache_pools,
             'mounts': self.check_lvm_mounts,
             'dm_devices': self.check_dm_devices,
@@ -1538,7 +1741,7 @@ class LVMStateChecker:
         }
         
         results = {}
-        with ThreadPoolExecutor(max_workers=4) as executor:
+        with ThreadPoolExecutor(max_workers=len(check_functions)) as executor:
             future_to_name = {executor.submit(func): name for name, func in check_functions.items()}
             for future in as_completed(future_to_name):
                 name = future_to_name[future]
@@ -1549,11 +1752,13 @@ class LVMStateChecker:
                         logger.error(f"Error in {name} check: {e}")
                     results[name] = []
         
+        self._save_state_cache()
+        
         disks = results.get('disks', [])
-        pvs = results.get('pvs', [])
-        vgs = results.get('vgs', [])
-        lvs = results.get('lvs', [])
-        thin_pools = results.get('thin_pools', [])
+        lvm_reports = results.get('lvm_reports') or {}
+        pvs = self._parse_physical_volumes(lvm_reports.get('pv', []))
+        vgs = self._parse_volume_groups(lvm_reports.get('vg', []))
+        lvs, thin_pools = self._parse_logical_volumes(lvm_reports.get('lv', []))
         cache_pools = results.get('cache_pools', [])
         mounts = results.get('mounts', [])
         dm_devices = results.get('dm_devices', [])
@@ -1568,26 +1773,9 @@ class LVMStateChecker:
                 if self.verbose:
                     logger.error(f"Error in plugin {plugin.name}: {e}")
         
-        issues, warnings = self.generate_health_report(pvs, vgs, lvs, thin_pools, cache_pools, disks)
-        
-        if not focused or (focused and (issues or warnings)):
-            self.display_physical_volumes(pvs, focused)
-            self.display_volume_groups(vgs, focused)
-            self.display_logical_volumes(lvs, focused)
-            self.display_thin_pools(thin_pools, focused)
-            if cache_pools:
-                self.display_cache_pools(cache_pools, focused)
-            self.display_disk_health(disks, focused)
-            self.display_mounts(mounts)
-            if dm_devices:
-                self.display_dm_devices(dm_devices)
-            self.display_metadata_backup(metadata_backup)
-        
-        self.display_summary(pvs, vgs, lvs, thin_pools, cache_pools, disks, mounts, dm_devices, issues, warnings, focused)
-        
-        elapsed = time.time() - start_time
-        if not focused:
-            print(f"\n{self._colorize(f'Check completed in {elapsed:.2f} seconds', Color.BLUE)}")
+        tables, healthy_counts, issues, warnings = self._render_all(
+            pvs, vgs, lvs, thin_pools, cache_pools, disks, focused, build_rows=self.show_tables and not self.brief
+        )
         
         self.health_check = LVMHealthCheck(
             pvs=pvs,
@@ -1604,6 +1792,26 @@ class LVMStateChecker:
             warnings=warnings
         )
         
+        skip_details = self.brief and self.health_check.overall_status is LVMStatus.HEALTHY
+        
+        if self.show_tables and not skip_details and (not focused or (focused and (issues or warnings))):
+            if self.brief:
+                tables = self._render_all(pvs, vgs, lvs, thin_pools, cache_pools, disks, focused)[0]
+            for key, title, headers in _DETAIL_TABLES:
+                if tables[key]:
+                    self._display_table(title, headers, tables[key])
+            self.display_mounts(mounts)
+            if dm_devices:
+                self.display_dm_devices(dm_devices)
+            self.display_metadata_backup(metadata_backup)
+        
+        self.display_summary(pvs, vgs, lvs, thin_pools, cache_pools, disks, mounts, dm_devices, issues, warnings, focused,
+                             healthy_counts)
+        
+        elapsed = time.time() - start_time
+        if not focused:
+            print(f"\n{self._colorize(f'Check completed in {elapsed:.2f} seconds', Color.BLUE)}")
+        
         if not focused:
             self.save_history(self.health_check)
             self.send_alert(self.health_check)
@@ -1618,9 +1826,9 @@ class LVMStateChecker:
         class LVMEncoder(json.JSONEncoder):
             def default(self, obj):
                 if isinstance(obj, LVMStatus):
-                    return obj.value
+                    return obj.name
                 if isinstance(obj, (PhysicalVolume, VolumeGroup, LogicalVolume, ThinPool, CachePool, DiskInfo)):
-                    return asdict(obj)
+                    return _shallow_dict(obj)
                 if hasattr(obj, '__dict__'):
                     return obj.__dict__
                 return super().default(obj)
@@ -1628,23 +1836,28 @@ class LVMStateChecker:
         try:
             data = {
                 'timestamp': self.health_check.timestamp,
-                'overall_status': self.health_check.overall_status.value,
+                'overall_status': self.health_check.overall_status.name,
                 'issues': self.health_check.issues,
                 'warnings': self.health_check.warnings,
-                'physical_volumes': [asdict(pv) for pv in self.health_check.pvs],
-                'volume_groups': [asdict(vg) for vg in self.health_check.vgs],
-                'logical_volumes': [asdict(lv) for lv in self.health_check.lvs],
-                'thin_pools': [asdict(pool) for pool in self.health_check.thin_pools],
-                'cache_pools': [asdict(pool) for pool in self.health_check.cache_pools],
-                'disks': [asdict(disk) for disk in self.health_check.disks],
+                'physical_volumes': [_shallow_dict(pv) for pv in self.health_check.pvs],
+                'volume_groups': [_shallow_dict(vg) for vg in self.health_check.vgs],
+                'logical_volumes': [_shallow_dict(lv) for lv in self.health_check.lvs],
+                'thin_pools': [_shallow_dict(pool) for pool in self.health_check.thin_pools],
+                'cache_pools': [_shallow_dict(pool) for pool in self.health_check.cache_pools],
+                'disks': [_shallow_dict(disk) for disk in self.health_check.disks],
                 'mounts': self.health_check.mounts,
                 'dm_devices': self.health_check.dm_devices,
                 'metadata_backup': self.health_check.metadata_backup
             }
             
             os.makedirs(os.path.dirname(os.path.abspath(filename)), exist_ok=True)
-            with open(filename, 'w') as f:
-                json.dump(data, f, indent=2, cls=LVMEncoder)
+            orjson = _load_orjson()
+            if orjson is not None:
+                payload = orjson.dumps(data, option=orjson.OPT_INDENT_2)
+            else:
+                payload = json.dumps(data, indent=2, cls=LVMEncoder).encode()
+            with open(filename, 'wb') as f:
+                f.write(payload)
             
             print(f"\n{self._colorize('✓', Color.GREEN)} Data exported to {filename}")
             return True
@@ -1659,52 +1872,43 @@ class LVMStateChecker:
         
         try:
             timestamp = int(time.time() * 1000)
-            metrics = []
-            
-            metrics.append("# HELP lvm_health_check LVM health check metrics")
-            metrics.append("# TYPE lvm_health_check gauge")
-            metrics.append(f'lvm_health_check{{type="overall"}} {1 if self.health_check.overall_status == LVMStatus.HEALTHY else 0} {timestamp}')
+            parts = [_PROM_HEALTH_HEADER]
+            parts.append(f'lvm_health_check{{type="overall"}} {1 if self.health_check.overall_status is LVMStatus.HEALTHY else 0} {timestamp}\n')
             
-            metrics.append("\n# HELP lvm_volume_group_free_percent Volume group free space percentage")
-            metrics.append("# TYPE lvm_volume_group_free_percent gauge")
+            parts.append(_PROM_VG_FREE_HEADER)
             for vg in self.health_check.vgs:
-                metrics.append(f'lvm_volume_group_free_percent{{vg="{vg.name}"}} {vg.free_percent:.2f} {timestamp}')
+                parts.append(f'lvm_volume_group_free_percent{{vg="{vg.name}"}} {vg.free_percent:.2f} {timestamp}\n')
             
-            metrics.append("\n# HELP lvm_volume_group_size Volume group total size in GB")
-            metrics.append("# TYPE lvm_volume_group_size gauge")
+            parts.append(_PROM_VG_SIZE_HEADER)
             for vg in self.health_check.vgs:
-                metrics.append(f'lvm_volume_group_size{{vg="{vg.name}"}} {vg.size_gb:.2f} {timestamp}')
+                parts.append(f'lvm_volume_group_size{{vg="{vg.name}"}} {vg.size_gb:.2f} {timestamp}\n')
             
-            metrics.append("\n# HELP lvm_thin_pool_usage Thin pool usage percentage")
-            metrics.append("# TYPE lvm_thin_pool_usage gauge")
+            parts.append(_PROM_THIN_POOL_HEADER)
             for pool in self.health_check.thin_pools:
-                metrics.append(f'lvm_thin_pool_usage{{pool="{pool.vg_name}/{pool.name}",type="data"}} {pool.data_percent:.2f} {timestamp}')
-                metrics.append(f'lvm_thin_pool_usage{{pool="{pool.vg_name}/{pool.name}",type="metadata"}} {pool.metadata_percent:.2f} {timestamp}')
+                parts.append(f'lvm_thin_pool_usage{{pool="{pool.vg_name}/{pool.name}",type="data"}} {pool.data_percent:.2f} {timestamp}\n')
+                parts.append(f'lvm_thin_pool_usage{{pool="{pool.vg_name}/{pool.name}",type="metadata"}} {pool.metadata_percent:.2f} {timestamp}\n')
             
-            metrics.append("\n# HELP lvm_disk_errors Disk I/O errors")
-            metrics.append("# TYPE lvm_disk_errors counter")
+            parts.append(_PROM_DISK_ERRORS_HEADER)
             for disk in self.health_check.disks:
-                metrics.append(f'lvm_disk_errors{{disk="{disk.name}",type="read"}} {disk.read_errors} {timestamp}')
-                metrics.append(f'lvm_disk_errors{{disk="{disk.name}",type="write"}} {disk.write_errors} {timestamp}')
+                parts.append(f'lvm_disk_errors{{disk="{disk.name}",type="read"}} {disk.read_errors} {timestamp}\n')
+                parts.append(f'lvm_disk_errors{{disk="{disk.name}",type="write"}} {disk.write_errors} {timestamp}\n')
             
-            metrics.append("\n# HELP lvm_cache_pool_usage Cache pool usage percentage")
-            metrics.append("# TYPE lvm_cache_pool_usage gauge")
+            parts.append(_PROM_CACHE_POOL_HEADER)
             for pool in self.health_check.cache_pools:
                 if pool.cache_total_blocks > 0:
                     usage = (pool.cache_used_blocks / pool.cache_total_blocks * 100)
                 else:
                     usage = 0
-                metrics.append(f'lvm_cache_pool_usage{{pool="{pool.vg_name}/{pool.name}"}} {usage:.2f} {timestamp}')
+                parts.append(f'lvm_cache_pool_usage{{pool="{pool.vg_name}/{pool.name}"}} {usage:.2f} {timestamp}\n')
             
-            metrics.append("\n# HELP lvm_disk_reallocated_sectors Reallocated disk sectors")
-            metrics.append("# TYPE lvm_disk_reallocated_sectors gauge")
+            parts.append(_PROM_REALLOCATED_HEADER)
             for disk in self.health_check.disks:
                 if disk.reallocated_sectors is not None:
-                    metrics.append(f'lvm_disk_reallocated_sectors{{disk="{disk.name}"}} {disk.reallocated_sectors} {timestamp}')
+                    parts.append(f'lvm_disk_reallocated_sectors{{disk="{disk.name}"}} {disk.reallocated_sectors} {timestamp}\n')
             
             os.makedirs(os.path.dirname(os.path.abspath(filename)), exist_ok=True)
-            with open(filename, 'w') as f:
-                f.write("\n".join(metrics))
+            with open(filename, 'wb') as f:
+                f.write("".join(parts).encode())
             
             print(f"\n{self._colorize('✓', Color.GREEN)} Prometheus metrics exported to {filename}")
             return True
@@ -1744,6 +1948,8 @@ Exit codes:
                        help='Command timeout in seconds')
     parser.add_argument('--cache-ttl', type=int, default=300,
                        help='Cache TTL in seconds')
+    parser.add_argument('--state-cache-ttl', type=int, default=30,
+                       help='Max age in seconds of LVM results reused from the on-disk state cache (0 disables it)')
     parser.add_argument('--config', '-c', default='/etc/lvm-health-check.conf',
                        help='Configuration file')
     parser.add_argument('--history-file', default='/var/log/lvm-health-history.json',
@@ -1752,6 +1958,13 @@ Exit codes:
                        help='Send alert on critical issues')
     parser.add_argument('--focused', '-f', action='store_true',
                        help='Show only components with issues or warnings')
+    parser.add_argument('--summary-only', action='store_true',
+                       help='Skip the detail tables when the system is healthy')
+    parser.add_argument('--no-table', action='store_true',
+                       help='Do not print tables, only the overall status, issues and warnings')
+    parser.add_argument('--refresh', action='store_true',
+                       help='Ignore the on-disk LVM state cache and query LVM directly; cached results are '
+                            'reused for up to --state-cache-ttl seconds, so usage figures may otherwise lag')
     parser.add_argument('--version', action='version', version='%(prog)s 2.0.0',
                        help='Show version and exit')
     
@@ -1762,9 +1975,13 @@ Exit codes:
             verbose=args.verbose,
             color=not args.no_color,
             timeout=args.timeout,
-            config_file=args.config
+            config_file=args.config,
+            brief=args.summary_only,
+            refresh=args.refresh,
+            tables=not args.no_table
         )
         checker._cache_ttl = args.cache_ttl
+        checker._state_cache_ttl = args.state_cache_ttl
         checker.history_file = args.history_file
         
         health_check = checker.run_full_check(focused=args.focused)
@@ -1776,9 +1993,9 @@ Exit codes:
             checker.export_prometheus(args.prom_file)
         
         exit_code = 0
-        if health_check.overall_status == LVMStatus.CRITICAL:
+        if health_check.overall_status is LVMStatus.CRITICAL:
             exit_code = 2
-        elif health_check.overall_status == LVMStatus.WARNING:
+        elif health_check.overall_status is LVMStatus.WARNING:
             exit_code = 1
         
         sys.exit(exit_code)